@@ -9,6 +9,7 @@ from algokit_utils.account import (
     get_kmd_wallet_account,
     get_localnet_default_account,
     get_or_create_kmd_wallet_account,
+    online_with_min_balance,
 )
 from algokit_utils.application_client import (
     ApplicationClient,
@@ -102,6 +103,7 @@ __all__ = [
     "get_dispenser_account",
     "get_kmd_wallet_account",
     "get_account",
+    "online_with_min_balance",
     "UPDATABLE_TEMPLATE_NAME",
     "DELETABLE_TEMPLATE_NAME",
     "NOTE_PREFIX",
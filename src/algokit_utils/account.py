@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 from typing import TYPE_CHECKING, Any
@@ -24,6 +25,7 @@ __all__ = [
     "get_kmd_wallet_account",
     "get_localnet_default_account",
     "get_or_create_kmd_wallet_account",
+    "online_with_min_balance",
 ]
 
 logger = logging.getLogger(__name__)
@@ -86,8 +88,22 @@ def get_or_create_kmd_wallet_account(
     return account
 
 
-def _is_default_account(account: dict[str, Any]) -> bool:
-    return bool(account["status"] != "Offline" and account["amount"] > _DEFAULT_ACCOUNT_MINIMUM_BALANCE)
+@functools.cache
+def online_with_min_balance(min_micro_algos: int) -> "Callable[[dict[str, Any]], bool]":
+    """Returns a KMD account predicate that matches accounts that aren't offline and hold more than `min_micro_algos`
+
+    The same predicate object is returned for the same `min_micro_algos`, so it has a stable identity that lookups
+    keyed by predicate (such as `AccountManager.from_kmd`) can cache against, unlike an equivalent inline lambda."""
+
+    def predicate(account: dict[str, Any]) -> bool:
+        status: str = account["status"]
+        amount: int = account["amount"]
+        return status != "Offline" and amount > min_micro_algos
+
+    return predicate
+
+
+_is_default_account = online_with_min_balance(_DEFAULT_ACCOUNT_MINIMUM_BALANCE)
 
 
 def get_localnet_default_account(client: "AlgodClient") -> Account:
@@ -1,3 +1,6 @@
+import time
+import weakref
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
@@ -5,20 +8,41 @@ from typing import Any
 from algokit_utils.account import get_dispenser_account, get_kmd_wallet_account, get_localnet_default_account
 from algosdk.account import generate_account
 from algosdk.atomic_transaction_composer import AccountTransactionSigner, TransactionSigner
+from algosdk.constants import TX_GROUP_LIMIT
+from algosdk.transaction import wait_for_confirmation
 from typing_extensions import Self
 
 from .client_manager import ClientManager
+from .composer import AlgokitComposer, PayParams
 
+_INFO_CACHE_MAX_SIZE = 1_024
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AddressAndSigner:
     address: str
     signer: TransactionSigner
 
 
+def _generate_random_account() -> AddressAndSigner:
+    (sk, addr) = generate_account()  # type: ignore[no-untyped-call]
+    return AddressAndSigner(address=addr, signer=AccountTransactionSigner(sk))
+
+
 class AccountManager:
     """Creates and keeps track of addresses and signers"""
 
+    __slots__ = (
+        "__weakref__",
+        "_accounts",
+        "_client_manager",
+        "_default_signer",
+        "_info_cache",
+        "_info_ttl",
+        "_kmd_cache",
+        "_kmd_predicate_cache",
+    )
+
     def __init__(self, client_manager: ClientManager):
         """
         Create a new account manager.
@@ -28,6 +52,15 @@ class AccountManager:
         self._client_manager = client_manager
         self._accounts = dict[str, TransactionSigner]()
         self._default_signer: TransactionSigner | None = None
+        # (sender, asset_id or None) -> (time.monotonic() when fetched, info), in least recently used order
+        self._info_cache = OrderedDict[tuple[str, int | None], tuple[float, dict[str, Any]]]()
+        self._info_ttl: float = 0  # seconds, caching is opt-in via `set_account_info_ttl`
+        # wallet name -> account found by `from_kmd` without a predicate, or None if it wasn't found
+        self._kmd_cache = dict[str, AddressAndSigner | None]()
+        # predicate -> the same as above for lookups with that predicate, dropped once the predicate is garbage collected
+        self._kmd_predicate_cache = weakref.WeakKeyDictionary[
+            Callable[[dict[str, Any]], bool], dict[str, AddressAndSigner | None]
+        ]()
 
     def set_default_signer(self, signer: TransactionSigner) -> Self:
         """
@@ -50,6 +83,9 @@ class AccountManager:
         self._accounts[sender] = signer
         return self
 
+    def _bulk_set_signers(self, signers: list[tuple[str, TransactionSigner]]) -> None:
+        self._accounts.update(signers)
+
     def get_signer(self, sender: str) -> TransactionSigner:
         """
         Returns the `TransactionSigner` for the given sender address.
@@ -59,7 +95,11 @@ class AccountManager:
         :param sender: The sender address
         :return: The `TransactionSigner` or throws an error if not found
         """
-        signer = self._accounts.get(sender, None) or self._default_signer
+        if not self._accounts:
+            # only a default signer (if any) has been registered, so there's nothing to look up
+            signer = self._default_signer
+        else:
+            signer = self._accounts.get(sender, None) or self._default_signer
         if not signer:
             raise ValueError(f"No signer found for address {sender}")
         return signer
@@ -68,6 +108,8 @@ class AccountManager:
         """
         Returns the given sender account's current status, balance and spendable amounts.
 
+        Results can be cached for a short time to coalesce repeated reads, see `set_account_info_ttl`.
+
         Example:
             address = "XBYLS2E6YI6XXL5BWCAMOA4GTWHXWENZMX5UHXMRNWWUQ7BXCY5WC5TEPA"
             account_info = account.get_information(address)
@@ -77,13 +119,61 @@ class AccountManager:
         :param sender: The address of the sender/account to look up
         :return: The account information
         """
-        info = self._client_manager.algod.account_info(sender)
-        assert isinstance(info, dict)
-        return info
+        return self._get_cached_info((sender, None), lambda: self._client_manager.algod.account_info(sender))
 
     def get_asset_information(self, sender: str, asset_id: int) -> dict[str, Any]:
-        info = self._client_manager.algod.account_asset_info(sender, asset_id)
+        """
+        Returns the given sender account's holding of the given asset.
+
+        `Response data schema details <https://developer.algorand.org/docs/rest-apis/algod/#get-v2accountsaddressassetsasset-id>`_
+
+        :param sender: The address of the sender/account to look up
+        :param asset_id: The ID of the asset to look up
+        :return: The account asset information
+        """
+        return self._get_cached_info(
+            (sender, asset_id), lambda: self._client_manager.algod.account_asset_info(sender, asset_id)
+        )
+
+    def set_account_info_ttl(self, seconds: float) -> Self:
+        """
+        Sets how long results from `get_information` and `get_asset_information` are cached for (disabled by default).
+
+        While caching is enabled, callers share the returned dicts so must treat them as read-only. Results can be
+        up to `seconds` old: the cache is only cleared after sends made via `AlgorandClient.send` (when waiting for
+        confirmation) and `AlgorandClient.send_many`, so call `invalidate_information_cache` after sending any other way.
+
+        :param seconds: The number of seconds to cache results for (e.g. 2.0, roughly one round), or 0 to disable caching
+        :return: The `AccountManager` so method calls can be chained
+        """
+        self._info_ttl = seconds
+        self._info_cache.clear()
+        return self
+
+    def invalidate_information_cache(self) -> Self:
+        """
+        Discards any cached results from `get_information` and `get_asset_information`.
+
+        :return: The `AccountManager` so method calls can be chained
+        """
+        self._info_cache.clear()
+        return self
+
+    def _get_cached_info(self, key: tuple[str, int | None], fetch: Callable[[], object]) -> dict[str, Any]:
+        now = time.monotonic()
+        cached = self._info_cache.get(key)
+        if cached is not None and now - cached[0] < self._info_ttl:
+            self._info_cache.move_to_end(key)
+            return cached[1]
+
+        info = fetch()
         assert isinstance(info, dict)
+        if self._info_ttl <= 0:
+            return info
+        self._info_cache[key] = (now, info)
+        self._info_cache.move_to_end(key)
+        if len(self._info_cache) > _INFO_CACHE_MAX_SIZE:
+            self._info_cache.popitem(last=False)
         return info
 
     # TODO
@@ -116,18 +206,57 @@ class AccountManager:
                 lambda a: a['status'] != 'Offline' and a['amount'] > 1_000_000_000
             )
 
+            # or equivalently, using a predicate that `from_kmd` can cache results for across calls
+            default_dispenser_account = account.from_kmd('unencrypted-default-wallet',
+                online_with_min_balance(1_000_000_000)
+            )
+
+        Results (including not finding an account) are remembered per wallet name and predicate until
+        `invalidate_kmd_cache` is called. Predicates are compared by identity and only remembered while they are
+        alive, so a new inline lambda on each call is never served from (or kept alive by) the cache.
+
         :param name: The name of the wallet to retrieve an account from
         :param predicate: An optional filter to use to find the account (otherwise it will return a random account from the wallet)
         :return: The account
         """
-        account = get_kmd_wallet_account(
-            name=name, predicate=predicate, client=self._client_manager.algod, kmd_client=self._client_manager.kmd
-        )
-        if not account:
+        cache = self._get_kmd_cache(predicate)
+        if cache is not None and name in cache:
+            cached = cache[name]
+        else:
+            account = get_kmd_wallet_account(
+                name=name, predicate=predicate, client=self._client_manager.algod, kmd_client=self._client_manager.kmd
+            )
+            cached = AddressAndSigner(address=account.address, signer=account.signer) if account else None
+            if cache is not None:
+                cache[name] = cached
+
+        if not cached:
             raise ValueError(f"Unable to find KMD account {name}{' with predicate' if predicate else ''}")
 
-        self.set_signer(account.address, account.signer)
-        return AddressAndSigner(address=account.address, signer=account.signer)
+        self.set_signer(cached.address, cached.signer)
+        return cached
+
+    def invalidate_kmd_cache(self) -> Self:
+        """
+        Discards the accounts (and missing accounts) remembered by `from_kmd`.
+
+        Use this if a KMD wallet has been created or changed since it was last looked up.
+
+        :return: The `AccountManager` so method calls can be chained
+        """
+        self._kmd_cache.clear()
+        self._kmd_predicate_cache.clear()
+        return self
+
+    def _get_kmd_cache(
+        self, predicate: Callable[[dict[str, Any]], bool] | None
+    ) -> dict[str, AddressAndSigner | None] | None:
+        if predicate is None:
+            return self._kmd_cache
+        try:
+            return self._kmd_predicate_cache.setdefault(predicate, {})
+        except TypeError:  # the predicate can't be weakly referenced, so don't remember results for it
+            return None
 
     # TODO
     # def multisig(
@@ -161,12 +290,48 @@ class AccountManager:
 
         :return: The account
         """
-        (sk, addr) = generate_account()  # type: ignore[no-untyped-call]
-        signer = AccountTransactionSigner(sk)
+        account = _generate_random_account()
+
+        self.set_signer(account.address, account.signer)
+
+        return account
+
+    def generate_test_accounts(self, *, count: int, initial_funds: int) -> list[AddressAndSigner]:
+        """
+        Tracks and returns new, random Algorand accounts with secret keys loaded, funded from the dispenser account.
+
+        The funding payments are sent in atomic groups (of up to 16 transactions) rather than one at a time, and all
+        the groups are submitted before waiting for any of them to be confirmed.
+
+        Example:
+            alice, bob = account.generate_test_accounts(count=2, initial_funds=1_000_000)
+
+        :param count: The number of accounts to create
+        :param initial_funds: The amount of µALGO to fund each account with
+        :return: The funded accounts
+        """
+        dispenser = self.dispenser()
+        accounts = [_generate_random_account() for _ in range(count)]
+        self._bulk_set_signers([(account.address, account.signer) for account in accounts])
+
+        algod = self._client_manager.algod
+        suggested_params = algod.suggested_params()
+        group_tx_ids = []
+        for start in range(0, count, TX_GROUP_LIMIT):
+            composer = AlgokitComposer(
+                algod=algod, get_signer=self.get_signer, get_suggested_params=lambda: suggested_params
+            )
+            for account in accounts[start : start + TX_GROUP_LIMIT]:
+                composer.add_payment(
+                    PayParams(sender=dispenser.address, receiver=account.address, amount=initial_funds)
+                )
+            group_tx_ids.append(composer.submit()[0])
 
-        self.set_signer(addr, signer)
+        for tx_id in group_tx_ids:
+            wait_for_confirmation(algod, tx_id)
 
-        return AddressAndSigner(address=addr, signer=signer)
+        self.invalidate_information_cache()
+        return accounts
 
     def dispenser(self) -> AddressAndSigner:
         """
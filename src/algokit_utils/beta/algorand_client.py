@@ -1,8 +1,8 @@
-import copy
+import functools
+import threading
 import time
-from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Any
+from copy import copy as shallow_copy
+from typing import Any, Literal
 
 from algokit_utils.beta.account_manager import AccountManager
 from algokit_utils.beta.client_manager import AlgoSdkClients, ClientManager
@@ -18,6 +18,7 @@ from algokit_utils.beta.composer import (
     MethodCallParams,
     OnlineKeyRegParams,
     PayParams,
+    TxnParams,
 )
 from algokit_utils.network_clients import (
     AlgoClientConfigs,
@@ -27,7 +28,7 @@ from algokit_utils.network_clients import (
     get_indexer_client,
     get_kmd_client,
 )
-from algosdk.atomic_transaction_composer import AtomicTransactionResponse, TransactionSigner
+from algosdk.atomic_transaction_composer import TransactionSigner
 from algosdk.transaction import SuggestedParams, Transaction, wait_for_confirmation
 from typing_extensions import Self
 
@@ -46,60 +47,155 @@ __all__ = [
 ]
 
 
-@dataclass
+# The well-known network configs below are built on first use and shared, they are only read by `ClientManager`
+@functools.cache
+def _localnet_config() -> AlgoClientConfigs:
+    return AlgoClientConfigs(
+        algod_config=get_default_localnet_config("algod"),
+        indexer_config=get_default_localnet_config("indexer"),
+        kmd_config=get_default_localnet_config("kmd"),
+    )
+
+
+@functools.cache
+def _algonode_config(network: Literal["testnet", "mainnet"]) -> AlgoClientConfigs:
+    return AlgoClientConfigs(
+        algod_config=get_algonode_config(network, "algod", ""),
+        indexer_config=get_algonode_config(network, "indexer", ""),
+        kmd_config=None,
+    )
+
+
 class AlgorandClientSendMethods:
     """
     Methods used to send a transaction to the network and wait for confirmation
+
+    Pass `wait=False` to return as soon as the transaction is submitted, in which case the `confirmation` in the
+    result is `None`. If account information caching is enabled (see `AccountManager.set_account_info_ttl`), call
+    `AccountManager.invalidate_information_cache` once the transaction is confirmed.
     """
 
-    payment: Callable[[PayParams], dict[str, Any]]
-    asset_create: Callable[[AssetCreateParams], dict[str, Any]]
-    asset_config: Callable[[AssetConfigParams], dict[str, Any]]
-    asset_freeze: Callable[[AssetFreezeParams], dict[str, Any]]
-    asset_destroy: Callable[[AssetDestroyParams], dict[str, Any]]
-    asset_transfer: Callable[[AssetTransferParams], dict[str, Any]]
-    app_call: Callable[[AppCallParams], dict[str, Any]]
-    online_key_reg: Callable[[OnlineKeyRegParams], dict[str, Any]]
-    method_call: Callable[[MethodCallParams], dict[str, Any]]
-    asset_opt_in: Callable[[AssetOptInParams], dict[str, Any]]
+    __slots__ = ("_client", "_send_single")
+
+    def __init__(self, client: "AlgorandClient"):
+        self._client = client
+        # bound once so each send calls straight into the client
+        self._send_single = client._send_single  # noqa: SLF001
+
+    def payment(self, params: PayParams, *, wait: bool = True) -> dict[str, Any]:
+        return self._send_single(self._client.new_group().add_payment(params), wait=wait)
+
+    def asset_create(self, params: AssetCreateParams, *, wait: bool = True) -> dict[str, Any]:
+        return self._send_single(self._client.new_group().add_asset_create(params), wait=wait)
+
+    def asset_config(self, params: AssetConfigParams, *, wait: bool = True) -> dict[str, Any]:
+        return self._send_single(self._client.new_group().add_asset_config(params), wait=wait)
+
+    def asset_freeze(self, params: AssetFreezeParams, *, wait: bool = True) -> dict[str, Any]:
+        return self._send_single(self._client.new_group().add_asset_freeze(params), wait=wait)
+
+    def asset_destroy(self, params: AssetDestroyParams, *, wait: bool = True) -> dict[str, Any]:
+        return self._send_single(self._client.new_group().add_asset_destroy(params), wait=wait)
+
+    def asset_transfer(self, params: AssetTransferParams, *, wait: bool = True) -> dict[str, Any]:
+        return self._send_single(self._client.new_group().add_asset_transfer(params), wait=wait)
+
+    def app_call(self, params: AppCallParams, *, wait: bool = True) -> dict[str, Any]:
+        return self._send_single(self._client.new_group().add_app_call(params), wait=wait)
+
+    def online_key_reg(self, params: OnlineKeyRegParams, *, wait: bool = True) -> dict[str, Any]:
+        return self._send_single(self._client.new_group().add_online_key_reg(params), wait=wait)
+
+    def method_call(self, params: MethodCallParams, *, wait: bool = True) -> dict[str, Any]:
+        return self._send_single(self._client.new_group().add_method_call(params), wait=wait)
+
+    def asset_opt_in(self, params: AssetOptInParams, *, wait: bool = True) -> dict[str, Any]:
+        return self._send_single(self._client.new_group().add_asset_opt_in(params), wait=wait)
 
 
-@dataclass
 class AlgorandClientTransactionMethods:
     """
     Methods used to form a transaction without signing or sending to the network
     """
 
-    payment: Callable[[PayParams], Transaction]
-    asset_create: Callable[[AssetCreateParams], Transaction]
-    asset_config: Callable[[AssetConfigParams], Transaction]
-    asset_freeze: Callable[[AssetFreezeParams], Transaction]
-    asset_destroy: Callable[[AssetDestroyParams], Transaction]
-    asset_transfer: Callable[[AssetTransferParams], Transaction]
-    app_call: Callable[[AppCallParams], Transaction]
-    online_key_reg: Callable[[OnlineKeyRegParams], Transaction]
-    method_call: Callable[[MethodCallParams], list[Transaction]]
-    asset_opt_in: Callable[[AssetOptInParams], Transaction]
+    __slots__ = ("_client",)
+
+    def __init__(self, client: "AlgorandClient"):
+        self._client = client
+
+    def payment(self, params: PayParams) -> Transaction:
+        return self._client.new_group().add_payment(params).build_group()[0].txn
+
+    def asset_create(self, params: AssetCreateParams) -> Transaction:
+        return self._client.new_group().add_asset_create(params).build_group()[0].txn
+
+    def asset_config(self, params: AssetConfigParams) -> Transaction:
+        return self._client.new_group().add_asset_config(params).build_group()[0].txn
+
+    def asset_freeze(self, params: AssetFreezeParams) -> Transaction:
+        return self._client.new_group().add_asset_freeze(params).build_group()[0].txn
+
+    def asset_destroy(self, params: AssetDestroyParams) -> Transaction:
+        return self._client.new_group().add_asset_destroy(params).build_group()[0].txn
+
+    def asset_transfer(self, params: AssetTransferParams) -> Transaction:
+        return self._client.new_group().add_asset_transfer(params).build_group()[0].txn
+
+    def app_call(self, params: AppCallParams) -> Transaction:
+        return self._client.new_group().add_app_call(params).build_group()[0].txn
+
+    def online_key_reg(self, params: OnlineKeyRegParams) -> Transaction:
+        return self._client.new_group().add_online_key_reg(params).build_group()[0].txn
+
+    def method_call(self, params: MethodCallParams) -> list[Transaction]:
+        return [txn.txn for txn in self._client.new_group().add_method_call(params).build_group()]
+
+    def asset_opt_in(self, params: AssetOptInParams) -> Transaction:
+        return self._client.new_group().add_asset_opt_in(params).build_group()[0].txn
 
 
 class AlgorandClient:
     """A client that brokers easy access to Algorand functionality."""
 
+    __slots__ = (
+        "__weakref__",
+        "_account_manager",
+        "_cached_suggested_params",
+        "_cached_suggested_params_expiry_ns",
+        "_cached_suggested_params_timeout",
+        "_client_manager",
+        "_composer_kwargs",
+        "_default_validity_window",
+        "_send",
+        "_suggested_params_lock",
+        "_transactions",
+    )
+
     def __init__(self, config: AlgoClientConfigs | AlgoSdkClients):
         self._client_manager: ClientManager = ClientManager(config)
         self._account_manager: AccountManager = AccountManager(self._client_manager)
 
         self._cached_suggested_params: SuggestedParams | None = None
-        self._cached_suggested_params_expiry: float | None = None
+        self._cached_suggested_params_expiry_ns: int | None = None  # time.monotonic_ns()
         self._cached_suggested_params_timeout: int = 3_000  # three seconds
+        self._suggested_params_lock = threading.Lock()
 
         self._default_validity_window: int = 10
+        self._composer_kwargs: dict[str, Any] | None = None  # built lazily by `new_group`
+
+        self._send = AlgorandClientSendMethods(self)
+        self._transactions = AlgorandClientTransactionMethods(self)
 
-    def _unwrap_single_send_result(self, results: AtomicTransactionResponse) -> dict[str, Any]:
-        return {
-            "confirmation": wait_for_confirmation(self._client_manager.algod, results.tx_ids[0]),
-            "tx_id": results.tx_ids[0],
-        }
+    def _send_single(self, composer: AlgokitComposer, *, wait: bool = True) -> dict[str, Any]:
+        if not wait:
+            # the transaction isn't confirmed yet, so invalidating cached account information here wouldn't help
+            return {"confirmation": None, "tx_id": composer.submit()[0]}
+
+        # submit and wait here rather than via `execute`, which would wait for confirmation a second time
+        tx_id = composer.submit()[0]
+        confirmation = wait_for_confirmation(self._client_manager.algod, tx_id)
+        self._account_manager.invalidate_information_cache()
+        return {"confirmation": confirmation, "tx_id": tx_id}
 
     def set_default_validity_window(self, validity_window: int) -> Self:
         """
@@ -109,6 +205,7 @@ class AlgorandClient:
         :return: The `AlgorandClient` so method calls can be chained
         """
         self._default_validity_window = validity_window
+        self._composer_kwargs = None
         return self
 
     def set_default_signer(self, signer: TransactionSigner) -> Self:
@@ -137,11 +234,16 @@ class AlgorandClient:
         Sets a cache value to use for suggested params.
 
         :param suggested_params: The suggested params to use
-        :param until: A timestamp until which to cache, or if not specified then the timeout is used
+        :param until: A (wall clock) timestamp until which to cache, or if not specified then the timeout is used
         :return: The `AlgorandClient` so method calls can be chained
         """
+        now_ns = time.monotonic_ns()
         self._cached_suggested_params = suggested_params
-        self._cached_suggested_params_expiry = until or time.time() + self._cached_suggested_params_timeout
+        self._cached_suggested_params_expiry_ns = (
+            now_ns + int((until - time.time()) * 1_000_000_000)
+            if until
+            else now_ns + self._cached_suggested_params_timeout * 1_000_000
+        )
         return self
 
     def set_suggested_params_timeout(self, timeout: int) -> Self:
@@ -154,17 +256,35 @@ class AlgorandClient:
         self._cached_suggested_params_timeout = timeout
         return self
 
-    def get_suggested_params(self) -> SuggestedParams:
-        """Get suggested params for a transaction (either cached or from algod if the cache is stale or empty)"""
-        if self._cached_suggested_params and (
-            self._cached_suggested_params_expiry is None or self._cached_suggested_params_expiry > time.time()
-        ):
-            return copy.deepcopy(self._cached_suggested_params)
+    def get_suggested_params(self, *, copy: bool = True) -> SuggestedParams:
+        """
+        Get suggested params for a transaction (either cached or from algod if the cache is stale or empty).
 
-        self._cached_suggested_params = self._client_manager.algod.suggested_params()
-        self._cached_suggested_params_expiry = time.time() + self._cached_suggested_params_timeout
+        Concurrent callers with a stale or empty cache share a single request to algod.
 
-        return copy.deepcopy(self._cached_suggested_params)
+        :param copy: Whether to return a copy of the cached params; if `False` the shared cached instance is returned
+            and must be treated as read-only
+        :return: The suggested params
+        """
+        params = self._get_suggested_params_shared()
+        return shallow_copy(params) if copy else params
+
+    def _get_suggested_params_shared(self) -> SuggestedParams:
+        # returns the cached instance itself, callers (e.g. `AlgokitComposer`) must only read from it
+        params = self._cached_suggested_params
+        expiry_ns = self._cached_suggested_params_expiry_ns
+        if params is None or (expiry_ns is not None and expiry_ns <= time.monotonic_ns()):
+            with self._suggested_params_lock:
+                params = self._cached_suggested_params
+                expiry_ns = self._cached_suggested_params_expiry_ns
+                if params is None or (expiry_ns is not None and expiry_ns <= time.monotonic_ns()):
+                    params = self._client_manager.algod.suggested_params()
+                    self._cached_suggested_params = params
+                    self._cached_suggested_params_expiry_ns = (
+                        time.monotonic_ns() + self._cached_suggested_params_timeout * 1_000_000
+                    )
+
+        return params
 
     @property
     def client(self) -> ClientManager:
@@ -178,61 +298,46 @@ class AlgorandClient:
 
     def new_group(self) -> AlgokitComposer:
         """Start a new `AlgokitComposer` transaction group"""
-        return AlgokitComposer(
-            algod=self.client.algod,
-            get_signer=lambda addr: self.account.get_signer(addr),
-            get_suggested_params=self.get_suggested_params,
-            default_validity_window=self._default_validity_window,
-        )
+        if self._composer_kwargs is None:
+            self._composer_kwargs = {
+                "algod": self._client_manager.algod,
+                "get_signer": self._account_manager.get_signer,
+                "get_suggested_params": self._get_suggested_params_shared,
+                "default_validity_window": self._default_validity_window,
+            }
+        return AlgokitComposer(**self._composer_kwargs)
 
     @property
     def send(self) -> AlgorandClientSendMethods:
         """Methods for sending a transaction and waiting for confirmation"""
-        return AlgorandClientSendMethods(
-            payment=lambda params: self._unwrap_single_send_result(self.new_group().add_payment(params).execute()),
-            asset_create=lambda params: self._unwrap_single_send_result(
-                self.new_group().add_asset_create(params).execute()
-            ),
-            asset_config=lambda params: self._unwrap_single_send_result(
-                self.new_group().add_asset_config(params).execute()
-            ),
-            asset_freeze=lambda params: self._unwrap_single_send_result(
-                self.new_group().add_asset_freeze(params).execute()
-            ),
-            asset_destroy=lambda params: self._unwrap_single_send_result(
-                self.new_group().add_asset_destroy(params).execute()
-            ),
-            asset_transfer=lambda params: self._unwrap_single_send_result(
-                self.new_group().add_asset_transfer(params).execute()
-            ),
-            app_call=lambda params: self._unwrap_single_send_result(self.new_group().add_app_call(params).execute()),
-            online_key_reg=lambda params: self._unwrap_single_send_result(
-                self.new_group().add_online_key_reg(params).execute()
-            ),
-            method_call=lambda params: self._unwrap_single_send_result(
-                self.new_group().add_method_call(params).execute()
-            ),
-            asset_opt_in=lambda params: self._unwrap_single_send_result(
-                self.new_group().add_asset_opt_in(params).execute()
-            ),
-        )
+        return self._send
+
+    def send_many(self, params_list: list[TxnParams]) -> list[dict[str, Any]]:
+        """
+        Sends each of the given transactions separately (i.e. not as an atomic group) and waits for them all to be confirmed.
+
+        All the transactions are submitted before waiting for any of them, so they can be confirmed in the same round
+        rather than one round after another.
+
+        :param params_list: The parameters of the transactions to send
+        :return: The transaction ID and confirmation of each transaction, in the same order as `params_list`
+        """
+        results = []
+        for params in params_list:
+            composer = self.new_group()
+            composer.txns.append(params)
+            results.append(self._send_single(composer, wait=False))
+
+        for result in results:
+            result["confirmation"] = wait_for_confirmation(self._client_manager.algod, result["tx_id"])
+        self._account_manager.invalidate_information_cache()
+
+        return results
 
     @property
     def transactions(self) -> AlgorandClientTransactionMethods:
         """Methods for building transactions"""
-
-        return AlgorandClientTransactionMethods(
-            payment=lambda params: self.new_group().add_payment(params).build_group()[0].txn,
-            asset_create=lambda params: self.new_group().add_asset_create(params).build_group()[0].txn,
-            asset_config=lambda params: self.new_group().add_asset_config(params).build_group()[0].txn,
-            asset_freeze=lambda params: self.new_group().add_asset_freeze(params).build_group()[0].txn,
-            asset_destroy=lambda params: self.new_group().add_asset_destroy(params).build_group()[0].txn,
-            asset_transfer=lambda params: self.new_group().add_asset_transfer(params).build_group()[0].txn,
-            app_call=lambda params: self.new_group().add_app_call(params).build_group()[0].txn,
-            online_key_reg=lambda params: self.new_group().add_online_key_reg(params).build_group()[0].txn,
-            method_call=lambda params: [txn.txn for txn in self.new_group().add_method_call(params).build_group()],
-            asset_opt_in=lambda params: self.new_group().add_asset_opt_in(params).build_group()[0].txn,
-        )
+        return self._transactions
 
     @staticmethod
     def default_local_net() -> "AlgorandClient":
@@ -241,13 +346,7 @@ class AlgorandClient:
 
         :return: The `AlgorandClient`
         """
-        return AlgorandClient(
-            AlgoClientConfigs(
-                algod_config=get_default_localnet_config("algod"),
-                indexer_config=get_default_localnet_config("indexer"),
-                kmd_config=get_default_localnet_config("kmd"),
-            )
-        )
+        return AlgorandClient(_localnet_config())
 
     @staticmethod
     def test_net() -> "AlgorandClient":
@@ -256,13 +355,7 @@ class AlgorandClient:
 
         :return: The `AlgorandClient`
         """
-        return AlgorandClient(
-            AlgoClientConfigs(
-                algod_config=get_algonode_config("testnet", "algod", ""),
-                indexer_config=get_algonode_config("testnet", "indexer", ""),
-                kmd_config=None,
-            )
-        )
+        return AlgorandClient(_algonode_config("testnet"))
 
     @staticmethod
     def main_net() -> "AlgorandClient":
@@ -271,13 +364,7 @@ class AlgorandClient:
 
         :return: The `AlgorandClient`
         """
-        return AlgorandClient(
-            AlgoClientConfigs(
-                algod_config=get_algonode_config("mainnet", "algod", ""),
-                indexer_config=get_algonode_config("mainnet", "indexer", ""),
-                kmd_config=None,
-            )
-        )
+        return AlgorandClient(_algonode_config("mainnet"))
 
     @staticmethod
     def from_clients(clients: AlgoSdkClients) -> "AlgorandClient":
@@ -32,7 +32,7 @@ class ClientManager:
     Exposes access to various API clients.
 
     Args:
-        clients_or_config (Union[AlgoConfig, AlgoSdkClients]): algosdk clients or config for interacting with the official Algorand APIs.
+        clients_or_configs (Union[AlgoClientConfigs, AlgoSdkClients]): algosdk clients or config for interacting with the official Algorand APIs.
     """
 
     def __init__(self, clients_or_configs: AlgoClientConfigs | AlgoSdkClients):
@@ -311,7 +311,7 @@ class AlgokitComposer:
         Args:
             algod (AlgodClient): An instance of AlgodClient used to get suggested params and send transactions.
             get_signer (Callable[[str], TransactionSigner]): A function that takes an address as input and returns a TransactionSigner for that address.
-            get_suggested_params (Optional[Callable[[], algosdk.future.transaction.SuggestedParams]], optional): A function that returns suggested parameters for transactions. If not provided, it defaults to using algod.suggested_params(). Defaults to None.
+            get_suggested_params (Optional[Callable[[], algosdk.future.transaction.SuggestedParams]], optional): A function that returns suggested parameters for transactions. If not provided, it defaults to using algod.suggested_params(). The returned params are only read from, so it may return a shared (cached) instance. Defaults to None.
             default_validity_window (Optional[int], optional): The default validity window for transactions. If not provided, it defaults to 10. Defaults to None.
         """
         self.txn_method_map: dict[str, algosdk.abi.Method] = {}
@@ -694,15 +694,22 @@ class AlgokitComposer:
 
         method_calls = {}
 
-        for i, ts in enumerate(txn_with_signers):
-            method = self.txn_method_map.get(ts.txn.get_txid())  # type: ignore[no-untyped-call]
-            if method:
-                method_calls[i] = method
+        # computing transaction IDs means encoding and hashing each transaction, so skip it when there are no method calls
+        if self.txn_method_map:
+            for i, ts in enumerate(txn_with_signers):
+                method = self.txn_method_map.get(ts.txn.get_txid())  # type: ignore[no-untyped-call]
+                if method:
+                    method_calls[i] = method
 
         self.atc.method_dict = method_calls
 
         return self.atc.build_group()
 
+    def submit(self) -> list[str]:
+        self.build_group()
+
+        return self.atc.submit(self.algod)
+
     def execute(self, *, max_rounds_to_wait: int | None = None) -> AtomicTransactionResponse:
         group = self.build_group()
 
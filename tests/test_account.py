@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from algokit_utils import get_account
+from algokit_utils import get_account, online_with_min_balance
 
 from tests.conftest import get_unique_name
 
@@ -14,3 +14,12 @@ def test_account_can_be_called_twice(algod_client: "AlgodClient") -> None:
     account2 = get_account(algod_client, account_name)
 
     assert account1 == account2
+
+
+def test_online_with_min_balance() -> None:
+    predicate = online_with_min_balance(1_000)
+
+    assert online_with_min_balance(1_000) is predicate
+    assert predicate({"status": "Online", "amount": 1_001})
+    assert not predicate({"status": "Online", "amount": 1_000})
+    assert not predicate({"status": "Offline", "amount": 1_001})
@@ -1,9 +1,12 @@
 import json
+import time
+import weakref
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
-from algokit_utils import Account, ApplicationClient
-from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils import Account, ApplicationClient, create_kmd_wallet_account
+from algokit_utils.beta.account_manager import AccountManager, AddressAndSigner
 from algokit_utils.beta.algorand_client import (
     AlgorandClient,
     AssetCreateParams,
@@ -11,8 +14,14 @@ from algokit_utils.beta.algorand_client import (
     MethodCallParams,
     PayParams,
 )
+from algokit_utils.beta.client_manager import AlgoSdkClients, ClientManager
 from algosdk.abi import Contract
-from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner, AtomicTransactionComposer
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+from tests.conftest import get_unique_name
 
 
 @pytest.fixture()
@@ -220,3 +229,149 @@ def test_add_method_call_with_two_method_call_args_with_txn_arg(
     assert result.abi_results[0].return_value == alice.address
     assert result.abi_results[1].return_value == alice.address
     assert result.abi_results[2].return_value == app_client.app_id
+
+
+def test_get_suggested_params_is_cached(algorand: AlgorandClient) -> None:
+    shared = algorand.get_suggested_params(copy=False)
+
+    assert algorand.get_suggested_params(copy=False) is shared
+    assert algorand.get_suggested_params() is not shared
+    assert algorand.get_suggested_params().first == shared.first
+
+
+def test_get_information_is_cached(algorand: AlgorandClient, alice: AddressAndSigner) -> None:
+    assert algorand.account.get_information(alice.address) is not algorand.account.get_information(alice.address)
+
+    algorand.account.set_account_info_ttl(60)
+    info = algorand.account.get_information(alice.address)
+
+    assert algorand.account.get_information(alice.address) is info
+
+    algorand.account.set_account_info_ttl(0)
+
+    assert algorand.account.get_information(alice.address) is not info
+
+
+def test_generate_test_accounts(algorand: AlgorandClient) -> None:
+    count = 17  # more than fits in one atomic group
+    initial_funds = 1_000_000
+
+    accounts = algorand.account.generate_test_accounts(count=count, initial_funds=initial_funds)
+
+    assert len({account.address for account in accounts}) == count
+    for account in accounts:
+        assert algorand.account.get_information(account.address)["amount"] == initial_funds
+
+
+def test_send_payment_returns_confirmation(algorand: AlgorandClient, alice: AddressAndSigner) -> None:
+    result = algorand.send.payment(PayParams(sender=alice.address, receiver=alice.address, amount=0))
+
+    assert result["confirmation"] is not None
+    assert result["confirmation"]["confirmed-round"] > 0
+    assert result["tx_id"]
+
+
+def test_send_payment_without_waiting(algorand: AlgorandClient, alice: AddressAndSigner) -> None:
+    result = algorand.send.payment(PayParams(sender=alice.address, receiver=alice.address, amount=0), wait=False)
+
+    assert result["confirmation"] is None
+    assert result["tx_id"]
+
+
+def test_send_many(algorand: AlgorandClient, alice: AddressAndSigner, bob: AddressAndSigner) -> None:
+    amount = 100_000
+
+    bob_pre_balance = algorand.account.get_information(bob.address)["amount"]
+    results = algorand.send_many(
+        [PayParams(sender=alice.address, receiver=bob.address, amount=amount, note=bytes([i])) for i in range(3)]
+    )
+    bob_post_balance = algorand.account.get_information(bob.address)["amount"]
+
+    assert all(result["confirmation"] is not None for result in results)
+    assert bob_post_balance == bob_pre_balance + amount * len(results)
+
+
+def test_get_signer_follows_signer_changes() -> None:
+    account_manager = AccountManager(ClientManager(AlgoSdkClients(algod=AlgodClient("", "http://localhost"))))
+    sender = generate_account()[1]  # type: ignore[no-untyped-call]
+    first_default, second_default, sender_signer, other_signer = (
+        AccountTransactionSigner(generate_account()[0])  # type: ignore[no-untyped-call]
+        for _ in range(4)
+    )
+    # register an unrelated sender so lookups go through the per-sender signers
+    account_manager.set_signer(generate_account()[1], other_signer)  # type: ignore[no-untyped-call]
+
+    account_manager.set_default_signer(first_default)
+    assert account_manager.get_signer(sender) is first_default
+
+    account_manager.set_default_signer(second_default)
+    assert account_manager.get_signer(sender) is second_default
+
+    account_manager.set_signer(sender, sender_signer)
+    assert account_manager.get_signer(sender) is sender_signer
+
+
+def _offline_algorand() -> AlgorandClient:
+    return AlgorandClient(AlgoSdkClients(algod=AlgodClient("", "http://localhost")))
+
+
+def _suggested_params(first: int) -> SuggestedParams:
+    return SuggestedParams(  # type: ignore[no-untyped-call]
+        fee=1_000, first=first, last=first + 1_000, gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=", flat_fee=False
+    )
+
+
+def test_validity_window_change_applies_to_new_transactions() -> None:
+    algorand = _offline_algorand().set_suggested_params(_suggested_params(first=100))
+    account = algorand.account.random()
+    params = PayParams(sender=account.address, receiver=account.address, amount=0)
+
+    assert algorand.transactions.payment(params).last_valid_round == 110  # noqa: PLR2004
+
+    algorand.set_default_validity_window(50)
+    assert algorand.transactions.payment(params).last_valid_round == 150  # noqa: PLR2004
+
+
+def test_set_suggested_params_until() -> None:
+    algorand = _offline_algorand()
+    pinned, fetched = _suggested_params(first=100), _suggested_params(first=200)
+
+    with patch.object(algorand.client.algod, "suggested_params", return_value=fetched) as suggested_params:
+        algorand.set_suggested_params(pinned, until=time.time() + 60)
+        assert algorand.get_suggested_params(copy=False) is pinned
+        assert suggested_params.call_count == 0
+
+        algorand.set_suggested_params(pinned, until=time.time() - 1)
+        assert algorand.get_suggested_params(copy=False) is fetched
+        assert suggested_params.call_count == 1
+
+
+def test_clients_support_weakrefs_but_not_new_attributes() -> None:
+    algorand = _offline_algorand()
+
+    assert weakref.ref(algorand)() is algorand
+    assert weakref.ref(algorand.account)() is algorand.account
+    with pytest.raises(AttributeError):
+        algorand.foo = 1  # type: ignore[attr-defined]
+    with pytest.raises(AttributeError):
+        algorand.account.foo = 1  # type: ignore[attr-defined]
+
+
+def test_from_kmd_remembers_missing_wallet(algorand: AlgorandClient) -> None:
+    wallet_name = get_unique_name()
+    kmd = algorand.client.kmd
+
+    with patch.object(kmd, "list_wallets", wraps=kmd.list_wallets) as list_wallets:
+        with pytest.raises(ValueError, match="Unable to find KMD account"):
+            algorand.account.from_kmd(wallet_name)
+        create_kmd_wallet_account(kmd, wallet_name)
+
+        with pytest.raises(ValueError, match="Unable to find KMD account"):
+            algorand.account.from_kmd(wallet_name)
+        assert list_wallets.call_count == 1
+
+        algorand.account.invalidate_kmd_cache()
+        account = algorand.account.from_kmd(wallet_name)
+
+        assert list_wallets.call_count == 2  # noqa: PLR2004
+        assert algorand.account.get_signer(account.address) is account.signer